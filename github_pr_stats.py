@@ -8,39 +8,166 @@ for the last 3 months and generates statistics per user.
 
 import os
 import argparse
+import asyncio
+import functools
+import heapq
+import json
+import pickle
+import sqlite3
 import sys
+import time
+from collections import Counter
+from contextlib import closing
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+import httpx
 from github import Github, GithubException
-from github.PullRequest import PullRequest
 from github.Repository import Repository
 from dotenv import load_dotenv
 from tqdm import tqdm
 
+GITHUB_API_URL = "https://api.github.com"
+
+# GitHub instance shared by get_github_instance once created
+_github_instance: Optional[Github] = None
+
+# Default maximum number of GitHub API requests in flight at once
+MAX_CONCURRENCY = 16
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'github_pr_stats')
+ETAG_CACHE_PATH = os.path.join(CACHE_DIR, 'etag.sqlite')
+REPO_CACHE_PATH = os.path.join(CACHE_DIR, 'repo_cache.pkl')
+
+# Largest page size the pulls listing endpoint allows (the default is 30)
+PULLS_PER_PAGE = 100
+
+# Retries for rate limited or failed requests, with exponential backoff capped at BACKOFF_MAX seconds
+MAX_RETRIES = 5
+BACKOFF_MAX = 60
+
+# Maximum number of node IDs GitHub accepts in a single nodes() lookup
+GRAPHQL_BATCH_SIZE = 100
+
+# PRStats counter a PR is tallied under, keyed by its (state, merged) pair
+PR_STATE_FIELDS = {
+    ('open', False): 'open',
+    ('open', True): 'open',
+    ('closed', True): 'merged',
+    ('closed', False): 'closed',
+}
+
+LINE_COUNTS_QUERY = """
+query($ids: [ID!]!) {
+  nodes(ids: $ids) {
+    ... on PullRequest {
+      id
+      additions
+      deletions
+    }
+  }
+}
+"""
+
 
 class PRStats:
+    """PR counters for all users, stored as one Counter per field keyed by username."""
+
+    __slots__ = ('open', 'merged', 'closed', 'total_lines', 'total_prs')
+
     def __init__(self):
-        self.open = 0
-        self.merged = 0
-        self.closed = 0
-        self.total_lines = 0
-        self.total_prs = 0
+        self.open: Counter = Counter()
+        self.merged: Counter = Counter()
+        self.closed: Counter = Counter()
+        self.total_lines: Counter = Counter()
+        self.total_prs: Counter = Counter()
+
+    def __len__(self) -> int:
+        return len(self.total_prs)
 
     def __str__(self) -> str:
-        return f"Open: {self.open}, Merged: {self.merged}, Closed: {self.closed}"
+        return (
+            f"Open: {sum(self.open.values())}, Merged: {sum(self.merged.values())}, "
+            f"Closed: {sum(self.closed.values())}"
+        )
+
+    def update(self, other: 'PRStats') -> None:
+        """Add the counters of another PRStats to this one."""
+        for field in self.__slots__:
+            getattr(self, field).update(getattr(other, field))
 
-    @property
-    def avg_lines_per_pr(self) -> float:
-        """Calculate average lines changed per PR."""
-        if self.total_prs == 0:
+    def avg_lines_per_pr(self, username: str) -> float:
+        """Calculate average lines changed per PR for a user."""
+        if self.total_prs[username] == 0:
             return 0.0
-        return round(self.total_lines / self.total_prs, 1)
+        return round(self.total_lines[username] / self.total_prs[username], 1)
+
+
+class CachedResponse(NamedTuple):
+    etag: str
+    next_url: Optional[str]
+    body: Any
+
+
+class ETagCache:
+    """
+    On-disk store of GitHub API responses keyed by URL.
+
+    Stored ETags are sent back as If-None-Match so that unchanged resources come
+    back as 304 Not Modified, which does not count against the rate limit.
+    """
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(url TEXT PRIMARY KEY, etag TEXT NOT NULL, next_url TEXT, body TEXT NOT NULL)"
+        )
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached response for a URL, if any."""
+        row = self._conn.execute(
+            "SELECT etag, next_url, body FROM responses WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        etag, next_url, body = row
+        return CachedResponse(etag, next_url, json.loads(body))
+
+    def set(self, url: str, etag: str, next_url: Optional[str], body: str) -> None:
+        """Store the raw response body for a URL along with its ETag."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (url, etag, next_url, body) VALUES (?, ?, ?, ?)",
+            (url, etag, next_url, body),
+        )
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
+
+
+def _positive_int(value: str) -> int:
+    """Argparse type for integer options that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> bool:
+    """Load environment variables from the .env file, only once per process."""
+    load_dotenv()
+    return True
 
 
 def parse_arguments() -> argparse.Namespace:
     """Parse command line arguments."""
     # Load environment variables
-    load_dotenv()
+    _load_env()
 
     parser = argparse.ArgumentParser(
         description="Generate PR statistics for a GitHub organization"
@@ -84,6 +211,33 @@ def parse_arguments() -> argparse.Namespace:
         help="Quiet mode - only output final table without progress bars"
     )
 
+    parser.add_argument(
+        "--top",
+        type=_positive_int,
+        metavar="N",
+        help="Only list the N users with the most merged PRs (totals still cover everyone)"
+    )
+
+    parser.add_argument(
+        "-j", "--jobs",
+        type=_positive_int,
+        default=MAX_CONCURRENCY,
+        help=f"Maximum number of concurrent GitHub API requests (default: {MAX_CONCURRENCY})"
+    )
+
+    parser.add_argument(
+        "--skip-inactive-repos",
+        action="store_true",
+        help="Skip repositories not pushed to since the start date (faster but approximate: misses PRs "
+             "closed without merging, opened from forks or only commented on)"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Do not read or write the API response and repository caches (stored in {CACHE_DIR})"
+    )
+
     return parser.parse_args()
 
 
@@ -105,105 +259,471 @@ def get_repos(g: Github, org_name: str) -> List[Repository]:
         print(f"Error accessing organization {org_name}: {e}")
         return []
 
-def analyze_prs(repos: List[Repository], start_date: datetime, end_date: datetime = None, quiet: bool = False) -> Dict[str, PRStats]:
+def _format_timestamp(value: datetime) -> str:
     """
-    Analyze PRs from all repositories and generate statistics.
+    Format a datetime the way the GitHub API formats timestamps (e.g. 2025-01-31T12:00:00Z).
+
+    GitHub timestamps are fixed-width UTC strings, so they order the same way
+    as the datetimes they represent and can be compared without parsing.
+    """
+    return value.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _open_etag_cache() -> Optional[ETagCache]:
+    """
+    Open the API response cache.
+
+    The cache only saves requests, so if it cannot be opened (e.g. the cache
+    directory is not writable) a warning is printed and None is returned.
+    """
+    try:
+        return ETagCache(ETAG_CACHE_PATH)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: API response cache disabled, cannot open {ETAG_CACHE_PATH}: {e}", file=sys.stderr)
+        return None
 
-    Args:
-        repos: List of repositories to analyze
-        start_date: Starting date for PR analysis
-        end_date: Ending date for PR analysis (optional)
-        quiet: Suppress progress output
+
+def _load_repo_cache() -> Dict[str, Tuple[tuple, PRStats]]:
+    """
+    Load the per-repository statistics saved by previous runs.
 
     Returns:
-        Dictionary mapping usernames to their PR statistics
+        Dictionary mapping repository full names to a (cache key, PRStats) tuple
     """
-    user_stats: Dict[str, PRStats] = {}
-    total_prs_count = 0
+    try:
+        with open(REPO_CACHE_PATH, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return {}
 
-    if not quiet:
-        print("\nCounting PRs...")
 
-    # First pass to count total PRs for progress bar (only if not quiet)
-    repo_iter = repos
-    if not quiet:
-        repo_iter = tqdm(repos, desc="Scanning repositories")
+def _save_repo_cache(repo_cache: Dict[str, Tuple[tuple, PRStats]]) -> None:
+    """
+    Save the per-repository statistics for later runs.
 
-    for repo in repo_iter:
+    The cache is written to a temporary file and moved into place, so an
+    interrupted write never leaves a truncated cache behind. Failing to save
+    only prints a warning.
+    """
+    tmp_path = f"{REPO_CACHE_PATH}.tmp"
+    try:
+        os.makedirs(os.path.dirname(REPO_CACHE_PATH), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(repo_cache, f)
+        os.replace(tmp_path, REPO_CACHE_PATH)
+    except OSError as e:
+        print(f"Warning: could not save repository cache to {REPO_CACHE_PATH}: {e}", file=sys.stderr)
         try:
-            pulls = repo.get_pulls(state='all', sort='updated', direction='desc')
-            for pr in pulls:
-                pr_updated = datetime.strptime(pr.updated_at.strftime('%Y-%m-%d %H:%M:%S'), '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc)
+            os.remove(tmp_path)
+        except OSError:
+            pass
 
-                # Skip if PR is outside date range
-                if pr_updated < start_date:
-                    break
-                if end_date and pr_updated > end_date:
-                    continue
 
-                total_prs_count += 1
-        except GithubException as e:
-            if not quiet:
-                print(f"\nError accessing PRs in {repo.name}: {e}")
-            continue
+def _backoff(attempt: int) -> float:
+    """Exponential backoff delay in seconds for a retry attempt (0-based)."""
+    return min(2 * 2 ** attempt, BACKOFF_MAX)
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+    """
+    Work out how long to wait before retrying a response.
 
-    # Second pass to analyze PRs
-    if not quiet:
-        print("\nAnalyzing PRs...")
+    Follows GitHub's guidance: honor Retry-After, otherwise wait for the primary
+    rate limit to reset when it is exhausted, and back off exponentially on
+    secondary rate limits and transient server errors.
 
-    if not quiet:
-        pbar = tqdm(total=total_prs_count, desc="Processing PRs")
+    Args:
+        response: Response to inspect
+        attempt: Number of retries already made for this request
+
+    Returns:
+        Delay in seconds, or None if the response should not be retried
+    """
+    status = response.status_code
+    remaining = response.headers.get('X-RateLimit-Remaining')
+
+    # GraphQL reports an exhausted rate limit in the body of a 200 response
+    rate_limited = status in (403, 429) or (remaining == '0' and b'RATE_LIMITED' in response.content)
+
+    if rate_limited:
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is not None:
+            return float(retry_after)
+        if remaining == '0':
+            return max(int(response.headers['X-RateLimit-Reset']) - time.time(), 0) + 1
+        if status == 429 or b'secondary rate limit' in response.content:
+            return _backoff(attempt)
+        return None
+
+    if status in (502, 503, 504):
+        return _backoff(attempt)
+    return None
+
+
+async def _request(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, method: str, url: str,
+                   **kwargs) -> httpx.Response:
+    """
+    Send a GitHub API request, waiting out rate limits and retrying transient failures.
 
-    for repo in repos:
+    Args:
+        client: HTTP client configured for the GitHub API
+        semaphore: Semaphore bounding the number of in-flight requests
+        method: HTTP method
+        url: URL to request
+        **kwargs: Extra arguments for httpx.AsyncClient.request
+
+    Returns:
+        The final response, which may still be an error once retries are exhausted
+    """
+    for attempt in range(MAX_RETRIES + 1):
         try:
-            pulls = repo.get_pulls(state='all', sort='updated', direction='desc')
-            for pr in pulls:
-                pr_updated = datetime.strptime(pr.updated_at.strftime('%Y-%m-%d %H:%M:%S'), '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc)
+            async with semaphore:
+                response = await client.request(method, url, **kwargs)
+        except httpx.TransportError:
+            if attempt == MAX_RETRIES:
+                raise
+            delay = _backoff(attempt)
+        else:
+            delay = _retry_delay(response, attempt)
+            if delay is None or attempt == MAX_RETRIES:
+                return response
+            if delay > BACKOFF_MAX:
+                tqdm.write(f"GitHub rate limit reached, waiting {round(delay)}s for it to reset...", file=sys.stderr)
+
+        await asyncio.sleep(delay)
+
+
+async def _get_json(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, cache: Optional[ETagCache],
+                    url: str) -> Tuple[Any, Optional[str], Optional[str]]:
+    """
+    GET a GitHub API URL, revalidating any cached copy with its ETag.
+
+    Args:
+        client: HTTP client configured for the GitHub API
+        semaphore: Semaphore bounding the number of in-flight requests
+        cache: Response cache, or None to always fetch
+        url: URL to fetch
+
+    Returns:
+        Tuple of the decoded JSON body, the URL of the next page (if any) and
+        the ETag the server returned or confirmed with a 304 (if any)
+    """
+    cached = cache.get(url) if cache else None
+    headers = {'If-None-Match': cached.etag} if cached else {}
+
+    response = await _request(client, semaphore, 'GET', url, headers=headers)
+
+    if cached and response.status_code == httpx.codes.NOT_MODIFIED:
+        return cached.body, cached.next_url, cached.etag
+    response.raise_for_status()
+
+    next_url = response.links.get('next', {}).get('url')
+    etag = response.headers.get('ETag')
+    if cache and etag:
+        cache.set(url, etag, next_url, response.text)
+    return response.json(), next_url, etag
+
+
+def _pulls_url(full_name: str) -> str:
+    """URL of the first page of a repository's PR listing, most recently updated first."""
+    return f"/repos/{full_name}/pulls?state=all&sort=updated&direction=desc&per_page={PULLS_PER_PAGE}"
+
+
+async def _listing_etag(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, cache: ETagCache,
+                        full_name: str) -> Optional[Tuple[Any, Optional[str], Optional[str]]]:
+    """
+    Revalidate the first page of a repository's PR listing.
+
+    Updating a PR in any way moves it to the top of the listing, so the first
+    page's ETag changes whenever any PR of the repository does.
+
+    Args:
+        client: HTTP client configured for the GitHub API
+        semaphore: Semaphore bounding the number of in-flight requests
+        cache: Response cache the ETag is stored in
+        full_name: Full name of the repository (owner/name)
 
+    Returns:
+        Tuple of the first page, the URL of the next page (if any) and the ETag
+        of this response (if any), or None if the page could not be fetched
+    """
+    try:
+        return await _get_json(client, semaphore, cache, _pulls_url(full_name))
+    except httpx.HTTPError:
+        return None
+
+
+async def _fetch_repo_prs(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, cache: Optional[ETagCache],
+                          full_name: str, start_date: datetime, end_date: datetime = None,
+                          quiet: bool = False,
+                          first_page: Optional[Tuple[Any, Optional[str]]] = None) -> Tuple[List[dict], bool]:
+    """
+    Fetch the PRs of a repository that were updated within the date range.
+
+    PRs are listed most recently updated first, so pagination stops at the
+    first PR older than start_date, without requesting any further page.
+    Every page is revalidated against its cached ETag, so unchanged pages
+    come back as free 304 responses.
+
+    Args:
+        client: HTTP client configured for the GitHub API
+        semaphore: Semaphore bounding the number of in-flight requests
+        cache: Response cache, or None to always fetch
+        full_name: Full name of the repository (owner/name)
+        start_date: Starting date for PR analysis
+        end_date: Ending date for PR analysis (optional)
+        quiet: Suppress progress output
+        first_page: Already fetched first page and next page URL, if any
+
+    Returns:
+        Tuple of the PR payloads as returned by the pulls listing endpoint, and
+        whether the listing was complete (False if a request failed)
+    """
+    prs = []
+    start = _format_timestamp(start_date)
+    end = _format_timestamp(end_date) if end_date else None
+    url = _pulls_url(full_name)
+
+    try:
+        while url:
+            if first_page is not None:
+                page, next_url = first_page
+                first_page = None
+            else:
+                page, next_url, _ = await _get_json(client, semaphore, cache, url)
+
+            for pr in page:
                 # Skip if PR is outside date range
-                if pr_updated < start_date:
-                    break
-                if end_date and pr_updated > end_date:
+                if pr['updated_at'] < start:
+                    return prs, True
+                if end and pr['updated_at'] > end:
                     continue
 
-                username = pr.user.login
-                if username not in user_stats:
-                    user_stats[username] = PRStats()
+                prs.append(pr)
 
-                if pr.state == 'open':
-                    user_stats[username].open += 1
-                elif pr.merged:
-                    user_stats[username].merged += 1
-                else:
-                    user_stats[username].closed += 1
+            url = next_url
+    except httpx.HTTPError as e:
+        if not quiet:
+            print(f"\nError accessing PRs in {full_name}: {e}")
+        return prs, False
 
-                user_stats[username].total_lines += pr.additions + pr.deletions
-                user_stats[username].total_prs += 1
+    return prs, True
 
-                if not quiet and 'pbar' in locals():
-                    pbar.update(1)
 
-        except GithubException as e:
+async def _fetch_line_counts(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, prs: List[dict],
+                             quiet: bool = False) -> Dict[str, int]:
+    """
+    Fetch the number of changed lines for a batch of PRs in a single GraphQL query.
+
+    The pulls listing endpoint does not include additions and deletions, and
+    fetching them through REST takes one request per PR.
+
+    Args:
+        client: HTTP client configured for the GitHub API
+        semaphore: Semaphore bounding the number of in-flight requests
+        prs: Up to GRAPHQL_BATCH_SIZE PR payloads from the pulls listing endpoint
+        quiet: Suppress progress output
+
+    Returns:
+        Dictionary mapping PR node IDs to lines changed (additions + deletions)
+    """
+    variables = {'ids': [pr['node_id'] for pr in prs]}
+
+    try:
+        response = await _request(client, semaphore, 'POST', '/graphql',
+                                  json={'query': LINE_COUNTS_QUERY, 'variables': variables})
+        response.raise_for_status()
+        payload = response.json()
+    except httpx.HTTPError as e:
+        if not quiet:
+            print(f"\nError fetching line counts: {e}")
+        return {}
+
+    if 'errors' in payload and not quiet:
+        print(f"\nError fetching line counts: {payload['errors'][0]['message']}")
+
+    return {
+        node['id']: node['additions'] + node['deletions']
+        for node in (payload.get('data') or {}).get('nodes', [])
+        if node
+    }
+
+
+async def _analyze_repo(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, cache: Optional[ETagCache],
+                        repo_cache: Dict[str, Tuple[tuple, PRStats]], repo: Repository, start_date: datetime,
+                        end_date: datetime, pbar: tqdm, quiet: bool = False) -> PRStats:
+    """
+    Analyze the PRs of a single repository updated within the date range.
+
+    When the response cache is enabled, statistics saved by an earlier run with
+    the same date range are reused as long as the first page of the PR listing
+    has not changed since.
+
+    Args:
+        client: HTTP client configured for the GitHub API
+        semaphore: Semaphore bounding the number of in-flight requests
+        cache: Response cache, or None to always fetch
+        repo_cache: Per-repository statistics from earlier runs, updated in place
+        repo: Repository to analyze
+        start_date: Starting date for PR analysis
+        end_date: Ending date for PR analysis (optional)
+        pbar: Progress bar advanced once per fetched PR
+        quiet: Suppress progress output
+
+    Returns:
+        PR statistics per user for this repository
+    """
+    cache_key = None
+    first_page = None
+    if cache:
+        listing = await _listing_etag(client, semaphore, cache, repo.full_name)
+        if listing:
+            page, next_url, etag = listing
+            first_page = (page, next_url)
+            if etag:
+                cache_key = (etag, _format_timestamp(start_date), _format_timestamp(end_date) if end_date else None)
+                cached = repo_cache.get(repo.full_name)
+                if cached and cached[0] == cache_key:
+                    return cached[1]
+
+    prs, complete = await _fetch_repo_prs(
+        client, semaphore, cache, repo.full_name, start_date, end_date, quiet, first_page
+    )
+
+    async def fetch(batch: List[dict]) -> None:
+        line_counts = await _fetch_line_counts(client, semaphore, batch, quiet)
+        for pr in batch:
+            pr['lines'] = line_counts.get(pr['node_id'])
+        pbar.update(len(batch))
+
+    await asyncio.gather(*[
+        fetch(prs[i:i + GRAPHQL_BATCH_SIZE]) for i in range(0, len(prs), GRAPHQL_BATCH_SIZE)
+    ])
+
+    # PRs whose line count could not be fetched are left out
+    pulls = [pr for pr in prs if pr['lines'] is not None]
+    complete = complete and len(pulls) == len(prs)
+    usernames = [pr['user']['login'] for pr in pulls]
+    stats = PRStats()
+    stats.total_prs.update(usernames)
+
+    state_counters = {key: getattr(stats, field) for key, field in PR_STATE_FIELDS.items()}
+
+    for username, pr in zip(usernames, pulls):
+        state_counters[pr['state'], pr['merged_at'] is not None][username] += 1
+        stats.total_lines[username] += pr['lines']
+
+    # Statistics missing PRs because of a failed request are not saved
+    if cache_key and complete:
+        repo_cache[repo.full_name] = (cache_key, stats)
+
+    return stats
+
+
+async def _analyze_async(repos: List[Repository], token: str, start_date: datetime, end_date: datetime = None,
+                         quiet: bool = False, use_cache: bool = True, jobs: int = MAX_CONCURRENCY,
+                         skip_inactive: bool = False) -> PRStats:
+    """
+    Fetch PRs from all repositories concurrently and generate statistics.
+
+    Args:
+        repos: List of repositories to analyze
+        token: GitHub token used to authenticate API requests
+        start_date: Starting date for PR analysis
+        end_date: Ending date for PR analysis (optional)
+        quiet: Suppress progress output
+        use_cache: Reuse cached API responses and repository statistics
+        jobs: Maximum number of GitHub API requests in flight at once
+        skip_inactive: Skip repositories not pushed to since start_date
+
+    Returns:
+        PR statistics per user
+    """
+    stats = PRStats()
+    semaphore = asyncio.Semaphore(jobs)
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+    }
+
+    cache = _open_etag_cache() if use_cache else None
+    repo_cache = _load_repo_cache() if use_cache else {}
+
+    active_repos = repos
+    if skip_inactive:
+        # Approximate: PRs closed without merging, opened from forks or only
+        # commented on do not push to the repository and are missed
+        active_repos = [
+            repo for repo in repos
+            if not repo.pushed_at or repo.pushed_at.replace(tzinfo=timezone.utc) >= start_date
+        ]
+
+    try:
+        async with httpx.AsyncClient(
+            base_url=GITHUB_API_URL,
+            headers=headers,
+            http2=True,
+            limits=httpx.Limits(max_connections=jobs),
+            timeout=30.0,
+        ) as client:
             if not quiet:
-                print(f"\nError accessing PRs in {repo.name}: {e}")
-            continue
+                print("\nAnalyzing PRs...")
+
+            # Single pass: each repository is listed and its PRs fetched as soon as
+            # the listing comes back, so the total is not known upfront
+            with tqdm(desc="Processing PRs", unit="PR", disable=quiet) as pbar:
+                repo_stats_list = await asyncio.gather(
+                    *[_analyze_repo(client, semaphore, cache, repo_cache, repo, start_date, end_date, pbar, quiet)
+                      for repo in active_repos]
+                )
+    finally:
+        if cache:
+            cache.close()
+
+    # Repositories are analyzed independently and merged once all are done
+    for repo_stats in repo_stats_list:
+        stats.update(repo_stats)
+
+    if use_cache:
+        _save_repo_cache(repo_cache)
+
+    return stats
+
 
-    if not quiet and 'pbar' in locals():
-        pbar.close()
+def analyze_prs(repos: List[Repository], token: str, start_date: datetime, end_date: datetime = None,
+                quiet: bool = False, use_cache: bool = True, jobs: int = MAX_CONCURRENCY,
+                skip_inactive: bool = False) -> PRStats:
+    """
+    Analyze PRs from all repositories and generate statistics.
+
+    Args:
+        repos: List of repositories to analyze
+        token: GitHub token used to authenticate API requests
+        start_date: Starting date for PR analysis
+        end_date: Ending date for PR analysis (optional)
+        quiet: Suppress progress output
+        use_cache: Reuse cached API responses and repository statistics
+        jobs: Maximum number of GitHub API requests in flight at once
+        skip_inactive: Skip repositories not pushed to since start_date
 
-    return user_stats
+    Returns:
+        PR statistics per user
+    """
+    return asyncio.run(_analyze_async(repos, token, start_date, end_date, quiet, use_cache, jobs, skip_inactive))
 
 
-def display_stats(stats: Dict[str, PRStats], start_date: datetime, end_date: datetime, repo_count: int, quiet: bool = False) -> None:
+def display_stats(stats: PRStats, start_date: datetime, end_date: datetime, repo_count: int, quiet: bool = False,
+                  top: Optional[int] = None) -> None:
     """
     Display PR statistics in a formatted table.
 
     Args:
-        stats: Dictionary mapping usernames to their PR statistics
+        stats: PR statistics per user
         start_date: Starting date for PR analysis
         end_date: Ending date for PR analysis
         repo_count: Number of repositories analyzed
         quiet: Suppress progress output
+        top: Only list this many users with the most merged PRs (optional)
     """
     if not stats:
         print("No PR statistics found.")
@@ -214,30 +734,30 @@ def display_stats(stats: Dict[str, PRStats], start_date: datetime, end_date: dat
         print(f"PR Statistics from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
         print(f"Analyzed {repo_count} repositories")
 
-    print("\nPull Request Statistics per User (sorted by merged PRs):")
+    if top:
+        print(f"\nPull Request Statistics per User (top {top} by merged PRs):")
+    else:
+        print("\nPull Request Statistics per User (sorted by merged PRs):")
     print("-" * 80)
     print(f"{'Username':<20} {'Open':<8} {'Merged':<8} {'Closed':<8} {'Total Lines':<12} {'Avg Lines/PR':<12}")
     print("-" * 80)
 
     # Sort by number of merged PRs in descending order
-    sorted_stats = sorted(
-        stats.items(),
-        key=lambda x: (x[1].merged, x[0]),  # Sort by merged count, then username
-        reverse=True  # Descending order
-    )
-
-    total_lines = 0
-    total_prs = 0
+    sort_key = lambda username: (stats.merged[username], username)  # Sort by merged count, then username
+    if top:
+        sorted_users = heapq.nlargest(top, stats.total_prs, key=sort_key)
+    else:
+        sorted_users = sorted(stats.total_prs, key=sort_key, reverse=True)  # Descending order
 
-    for username, pr_stats in sorted_stats:
-        total_lines += pr_stats.total_lines
-        total_prs += pr_stats.total_prs
+    for username in sorted_users:
         print(
-            f"{username:<20} {pr_stats.open:<8} {pr_stats.merged:<8} {pr_stats.closed:<8} "
-            f"{pr_stats.total_lines:<12} {pr_stats.avg_lines_per_pr:<12}"
+            f"{username:<20} {stats.open[username]:<8} {stats.merged[username]:<8} {stats.closed[username]:<8} "
+            f"{stats.total_lines[username]:<12} {stats.avg_lines_per_pr(username):<12}"
         )
 
     print("-" * 80)
+    total_lines = sum(stats.total_lines.values())
+    total_prs = sum(stats.total_prs.values())
     avg_lines = round(total_lines / total_prs, 1) if total_prs > 0 else 0
     print(f"{'TOTAL':<20} {'':<8} {'':<8} {'':<8} {total_lines:<12} {avg_lines:<12}")
 
@@ -245,7 +765,16 @@ def display_stats(stats: Dict[str, PRStats], start_date: datetime, end_date: dat
 def get_github_instance() -> Optional[Github]:
     """
     Create GitHub instance using token from .env file.
+
+    The first successfully created instance is shared by later calls; failures
+    are not remembered, so a later call can succeed once the token is set.
     """
+    global _github_instance
+    if _github_instance is not None:
+        return _github_instance
+
+    _load_env()
+
     token = os.getenv('GITHUB_TOKEN')
     if not token:
         print("Error: GITHUB_TOKEN not found in environment or .env file")
@@ -255,75 +784,77 @@ def get_github_instance() -> Optional[Github]:
         return None
 
     try:
-        return Github(token)
+        _github_instance = Github(token)
     except Exception as e:
         print(f"Error authenticating with GitHub: {e}")
         return None
+    return _github_instance
 
 
 def main():
     """Main function to run the script."""
     args = parse_arguments()
 
-    try:
-        g = get_github_instance()
-        if not g:
-            print("Failed to authenticate with GitHub")
-            return
-
-        # Determine date range for analysis
-        end_date = None
-        if args.start_date:
-            # Use specific date range
-            start_date = args.start_date
-
-            if args.end_date:
-                end_date = args.end_date
+    g = get_github_instance()
+    if not g:
+        print("Failed to authenticate with GitHub")
+        return
+
+    with closing(g):
+        try:
+            # Determine date range for analysis
+            end_date = None
+            if args.start_date:
+                # Use specific date range
+                start_date = args.start_date
+
+                if args.end_date:
+                    end_date = args.end_date
+                else:
+                    # Default end date is today
+                    end_date = datetime.now(timezone.utc).replace(
+                        hour=23, minute=59, second=59, microsecond=999999
+                    )
+
+                if not args.quiet:
+                    print(f"\nAnalyzing PRs from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
             else:
-                # Default end date is today
+                # Use days (default approach)
+                start_date = datetime.now(timezone.utc).replace(
+                    hour=0, minute=0, second=0, microsecond=0
+                ) - timedelta(days=args.days)
+
+                if not args.quiet:
+                    print(f"\nAnalyzing PRs for the last {args.days} days...")
+
+                # Ensure end_date is set for consistency
                 end_date = datetime.now(timezone.utc).replace(
                     hour=23, minute=59, second=59, microsecond=999999
                 )
 
             if not args.quiet:
-                print(f"\nAnalyzing PRs from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
-        else:
-            # Use days (default approach)
-            start_date = datetime.now(timezone.utc).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            ) - timedelta(days=args.days)
+                print("\nFetching repositories...")
+            repos = get_repos(g, args.org_name)
+            if not repos:
+                print("No repositories found or error accessing organization.")
+                return
 
             if not args.quiet:
-                print(f"\nAnalyzing PRs for the last {args.days} days...")
+                print(f"Found {len(repos)} repositories")
 
-            # Ensure end_date is set for consistency
-            end_date = datetime.now(timezone.utc).replace(
-                hour=23, minute=59, second=59, microsecond=999999
+            # Analyze PRs with date range
+            stats = analyze_prs(
+                repos, os.getenv('GITHUB_TOKEN'), start_date, end_date, args.quiet, not args.no_cache, args.jobs,
+                args.skip_inactive_repos
             )
 
-        if not args.quiet:
-            print("\nFetching repositories...")
-        repos = get_repos(g, args.org_name)
-        if not repos:
-            print("No repositories found or error accessing organization.")
-            return
-
-        if not args.quiet:
-            print(f"Found {len(repos)} repositories")
+            # Display results
+            display_stats(stats, start_date, end_date, len(repos), args.quiet, args.top)
 
-        # Analyze PRs with date range
-        stats = analyze_prs(repos, start_date, end_date, args.quiet)
-
-        # Display results
-        display_stats(stats, start_date, end_date, len(repos), args.quiet)
-
-    except GithubException as e:
-        print(f"GitHub API error: {e}")
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
-    finally:
-        if 'g' in locals():
-            g.close()
+        except GithubException as e:
+            print(f"GitHub API error: {e}")
+        except Exception as e:
+            print(f"An unexpected error occurred: {e}")
 
 
 if __name__ == "__main__":
@@ -5,60 +5,69 @@ import os
 import json
 import re
 from datetime import datetime
+from jinja2 import Template
+
+DATE_RANGE_RE = re.compile(r'PR Statistics from (\d{4}-\d{2}-\d{2}) to (\d{4}-\d{2}-\d{2})')
+REPO_COUNT_RE = re.compile(r'Analyzed (\d+) repositories')
+TABLE_HEADING = 'Pull Request Statistics per User'
+
+SLACK_TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'slack_template.json')
+
+_slack_template = None
+
+def get_slack_template():
+    """Load and compile the Slack message template, only once per process"""
+    global _slack_template
+    if _slack_template is None:
+        with open(SLACK_TEMPLATE_PATH, 'r') as template_file:
+            _slack_template = Template(template_file.read())
+    return _slack_template
 
 def format_stats_for_slack():
     """Read stats output and format as Slack message"""
     try:
+        date_match = None
+        repo_count_match = None
+        header_lines = []
+        table_lines = []
+        in_table = False
+
+        # Stream the output: the date range and repository count come before the
+        # table, and everything after the "per User" heading is the table
         with open('stats_output.txt', 'r') as f:
-            stats_content = f.read()
-        
-        # Extract the date range and repository count
-        date_match = re.search(r'PR Statistics from (\d{4}-\d{2}-\d{2}) to (\d{4}-\d{2}-\d{2})', stats_content)
-        repo_count_match = re.search(r'Analyzed (\d+) repositories', stats_content)
+            for line in f:
+                if in_table:
+                    table_lines.append(line)
+                elif line.startswith(TABLE_HEADING):
+                    in_table = True
+                else:
+                    header_lines.append(line)
+                    date_match = date_match or DATE_RANGE_RE.search(line)
+                    repo_count_match = repo_count_match or REPO_COUNT_RE.search(line)
         
         date_range = f"{date_match.group(1)} to {date_match.group(2)}" if date_match else "custom period"
         repo_count = repo_count_match.group(1) if repo_count_match else "multiple"
         
-        # Find the table in the output (everything after "sorted by merged PRs")
-        table_match = re.search(r'Pull Request Statistics per User.*?\n(.*)', stats_content, re.DOTALL)
-        if table_match:
-            table_content = table_match.group(1)
+        # Fall back to the whole output if there was no table heading
+        if in_table:
+            table_content = ''.join(table_lines)
         else:
-            table_content = stats_content
+            table_content = ''.join(header_lines)
             
         # Get month name for title
         month_name = os.environ.get('PERIOD') or datetime.now().strftime("%B %Y")
             
-        # Create formatted Slack message
-        slack_message = {
-            "blocks": [
-                {
-                    "type": "header",
-                    "text": {
-                        "type": "plain_text",
-                        "text": f"PR Statistics for {month_name}"
-                    }
-                },
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn", 
-                        "text": f"*Period:* {date_range}\n*Repositories analyzed:* {repo_count}"
-                    }
-                },
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": "```\n" + table_content + "```"
-                    }
-                }
-            ]
-        }
+        # Render the Slack message from the template, which produces JSON directly
+        slack_payload = get_slack_template().render(
+            month_name=month_name,
+            date_range=date_range,
+            repo_count=repo_count,
+            table=table_content,
+        )
         
         # Save as JSON file for the GitHub Action
         with open('slack_payload.json', 'w') as f:
-            json.dump(slack_message, f)
+            f.write(slack_payload)
             
         print("Slack message payload created successfully.")
         